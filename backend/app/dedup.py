@@ -0,0 +1,112 @@
+import math
+import os
+import threading
+import time
+from collections.abc import Iterable
+
+INGEST_DEDUP_WINDOW_SECONDS = float(os.getenv("INGEST_DEDUP_WINDOW_SECONDS", "600"))
+INGEST_DEDUP_CAPACITY = int(os.getenv("INGEST_DEDUP_CAPACITY", "1000000"))
+INGEST_DEDUP_FP_RATE = float(os.getenv("INGEST_DEDUP_FP_RATE", "0.001"))
+
+
+class _BloomFilter:
+    def __init__(self, capacity: int, fp_rate: float) -> None:
+        self.size = max(8, int(-capacity * math.log(fp_rate) / (math.log(2) ** 2)))
+        self.hashes = max(1, round(self.size / capacity * math.log(2)))
+        self.bits = bytearray((self.size + 7) // 8)
+        self.count = 0
+
+    def _positions(self, key: str) -> list[int]:
+        # str caches its hash, and the filter never leaves the process, so the
+        # per-process hash seed is fine. Enhanced double hashing over its two halves:
+        # the growing step keeps probes distinct even when h2 % size == 0.
+        h = hash(key) & 0xFFFFFFFFFFFFFFFF
+        size = self.size
+        x, y = (h & 0xFFFFFFFF) % size, (h >> 32) % size
+        positions = []
+        for i in range(self.hashes):
+            positions.append(x)
+            x = (x + y) % size
+            y = (y + i) % size
+        return positions
+
+    def contains(self, positions: list[int]) -> bool:
+        return all(self.bits[p >> 3] & (1 << (p & 7)) for p in positions)
+
+    def add(self, positions: list[int]) -> None:
+        for p in positions:
+            self.bits[p >> 3] |= 1 << (p & 7)
+        self.count += 1
+
+
+class RotatingBloomFilter:
+    """Remembers keys for up to two windows.
+
+    A window also ends once it holds `capacity` keys, so keys can be forgotten sooner
+    under load. A hit means "probably seen": up to `fp_rate` of unseen keys hit each
+    generation, so about twice that once both are full.
+    """
+
+    def __init__(self, window_seconds: float, capacity: int, fp_rate: float) -> None:
+        self.window_seconds = window_seconds
+        self.capacity = capacity
+        self.fp_rate = fp_rate
+        self._lock = threading.Lock()
+        self._current = _BloomFilter(capacity, fp_rate)
+        self._previous: _BloomFilter | None = None
+        self._rotated_at = time.monotonic()
+
+    def _rotate_if_due(self, adding: bool = False) -> None:
+        if time.monotonic() - self._rotated_at >= self.window_seconds or (
+            adding and self._current.count >= self.capacity
+        ):
+            self._previous = self._current
+            self._current = _BloomFilter(self.capacity, self.fp_rate)
+            self._rotated_at = time.monotonic()
+
+    def _seen(self, positions: list[int]) -> bool:
+        return self._current.contains(positions) or (
+            self._previous is not None and self._previous.contains(positions)
+        )
+
+    def seen(self, key: str) -> bool:
+        positions = self._current._positions(key)
+        with self._lock:
+            self._rotate_if_due()
+            return self._seen(positions)
+
+    def add_many(self, keys: Iterable[str]) -> None:
+        hashed = [self._current._positions(key) for key in keys]
+        with self._lock:
+            for positions in hashed:
+                self._rotate_if_due(adding=True)
+                if not self._current.contains(positions):
+                    self._current.add(positions)
+
+
+
+recent_event_ids = RotatingBloomFilter(
+    window_seconds=INGEST_DEDUP_WINDOW_SECONDS,
+    capacity=INGEST_DEDUP_CAPACITY,
+    fp_rate=INGEST_DEDUP_FP_RATE,
+)
+
+_stats_lock = threading.Lock()
+stats: dict[str, int] = {
+    "received": 0,
+    "dropped_in_batch": 0,
+    "dropped_by_filter": 0,
+    "filter_false_positives": 0,
+    "dropped_on_conflict": 0,
+}
+
+
+def record(**counts: int) -> None:
+    with _stats_lock:
+        for name, value in counts.items():
+            stats[name] += value
+
+
+def snapshot() -> dict[str, int]:
+    with _stats_lock:
+        return dict(stats)
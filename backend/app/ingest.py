@@ -1,32 +1,80 @@
 from fastapi import APIRouter, Depends
+from sqlalchemy import select
+from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.orm import Session
 
+from . import dedup, screen_sources
 from .db import get_db
 from .models import Event
-from .schemas import EventBatchIn
+from .schemas import EventBatchIn, EventIn
 
 router = APIRouter()
 
+# Keeps the confirm query well under the Postgres bind-parameter limit.
+CONFIRM_CHUNK_SIZE = 10_000
+
 
 @router.post("/v1/events/batch")
 def ingest_events(payload: EventBatchIn, db: Session = Depends(get_db)) -> dict[str, int]:
+    batch_ids: set[str] = set()
+    accepted: list[EventIn] = []
+    hits: list[EventIn] = []
+    for e in payload.events:
+        if e.event_id in batch_ids:
+            continue
+        batch_ids.add(e.event_id)
+        if dedup.recent_event_ids.seen(e.event_id):
+            hits.append(e)
+        else:
+            accepted.append(e)
+
+    # Filter hits are only "probably seen": confirm them on the event_id index.
+    stored: set[str] = set()
+    hit_ids = [e.event_id for e in hits]
+    for start in range(0, len(hit_ids), CONFIRM_CHUNK_SIZE):
+        chunk = hit_ids[start : start + CONFIRM_CHUNK_SIZE]
+        stored.update(db.execute(select(Event.event_id).where(Event.event_id.in_(chunk))).scalars())
+    accepted += [e for e in hits if e.event_id not in stored]
+
+    screen_sources.ensure_loaded(db)
     rows = [
-        Event(
-            event_id=e.event_id,
-            name=e.name,
-            ts=e.ts,
-            user_id=e.user_id,
-            session_id=e.session_id,
-            platform=e.platform,
-            app_version=e.app_version,
-            os_version=e.os_version,
-            device_model=e.device_model,
-            screen=e.screen,
-            source=e.source,
-            props=e.props,
-        )
-        for e in payload.events
+        {
+            "event_id": e.event_id,
+            "name": e.name,
+            "ts": e.ts,
+            "user_id": e.user_id,
+            "session_id": e.session_id,
+            "platform": e.platform,
+            "app_version": e.app_version,
+            "os_version": e.os_version,
+            "device_model": e.device_model,
+            "screen": e.screen,
+            "source": screen_sources.get_source(e.screen) or e.source,
+            "props": e.props,
+        }
+        for e in accepted
     ]
-    db.add_all(rows)
+    ingested = 0
+    if rows:
+        # Backstop for duplicates the filter no longer remembers (restarts, other workers).
+        ingested = len(
+            db.execute(insert(Event).on_conflict_do_nothing().returning(Event.id), rows).all()
+        )
     db.commit()
-    return {"ingested": len(rows)}
+    # Only after the commit, so a failed batch can be retried.
+    dedup.recent_event_ids.add_many(e.event_id for e in accepted)
+
+    duplicates = len(payload.events) - ingested
+    dedup.record(
+        received=len(payload.events),
+        dropped_in_batch=len(payload.events) - len(batch_ids),
+        dropped_by_filter=len(stored),
+        filter_false_positives=len(hits) - len(stored),
+        dropped_on_conflict=len(rows) - ingested,
+    )
+    return {"ingested": ingested, "duplicates": duplicates}
+
+
+@router.get("/v1/events/dedup-stats")
+def get_dedup_stats() -> dict[str, int]:
+    return dedup.snapshot()
@@ -2,7 +2,7 @@ from fastapi import APIRouter, Depends, HTTPException
 from sqlalchemy import desc, select
 from sqlalchemy.orm import Session
 
-from .db import get_db
+from .db import get_read_db
 from .models import Issue
 from .schemas import IssueOut, RecommendationOut
 
@@ -10,13 +10,13 @@ router = APIRouter()
 
 
 @router.get("/v1/issues", response_model=list[IssueOut])
-def list_issues(limit: int = 50, db: Session = Depends(get_db)) -> list[Issue]:
+def list_issues(limit: int = 50, db: Session = Depends(get_read_db)) -> list[Issue]:
     query = select(Issue).order_by(desc(Issue.created_at)).limit(limit)
     return db.execute(query).scalars().all()
 
 
 @router.get("/v1/issues/{key}", response_model=IssueOut)
-def get_issue(key: str, db: Session = Depends(get_db)) -> Issue:
+def get_issue(key: str, db: Session = Depends(get_read_db)) -> Issue:
     issue = db.execute(select(Issue).where(Issue.key == key)).scalar_one_or_none()
     if not issue:
         raise HTTPException(404, "Issue not found")
@@ -24,7 +24,7 @@ def get_issue(key: str, db: Session = Depends(get_db)) -> Issue:
 
 
 @router.get("/v1/recommendations", response_model=list[RecommendationOut])
-def list_recommendations(limit: int = 50, db: Session = Depends(get_db)) -> list[RecommendationOut]:
+def list_recommendations(limit: int = 50, db: Session = Depends(get_read_db)) -> list[RecommendationOut]:
     issues = db.execute(select(Issue).order_by(desc(Issue.created_at)).limit(limit)).scalars().all()
     return [
         RecommendationOut(
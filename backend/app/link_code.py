@@ -1,22 +1,26 @@
 from fastapi import APIRouter, Depends
-from sqlalchemy import select
 from sqlalchemy.orm import Session
 
+from . import screen_sources
 from .db import get_db
-from .models import ScreenLink
-from .schemas import LinkCodeIn
+from .schemas import LinkCodeBatchIn, LinkCodeIn
 
 router = APIRouter()
 
 
 @router.post("/v1/link-code")
 def link_code(payload: LinkCodeIn, db: Session = Depends(get_db)) -> dict[str, str]:
-    existing = db.execute(
-        select(ScreenLink).where(ScreenLink.screen == payload.screen)
-    ).scalar_one_or_none()
-    if existing:
-        existing.source = payload.source
-    else:
-        db.add(ScreenLink(screen=payload.screen, source=payload.source))
+    links = {payload.screen: payload.source}
+    screen_sources.upsert(db, links)
     db.commit()
+    screen_sources.remember(links)
     return {"screen": payload.screen, "source": payload.source}
+
+
+@router.post("/v1/link-code/bulk")
+def link_code_bulk(payload: LinkCodeBatchIn, db: Session = Depends(get_db)) -> dict[str, int]:
+    links = {item.screen: item.source for item in payload.links}
+    screen_sources.upsert(db, links)
+    db.commit()
+    screen_sources.remember(links)
+    return {"linked": len(links)}
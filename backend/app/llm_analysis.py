@@ -11,7 +11,8 @@ from openai import OpenAIError
 from sqlalchemy import text
 from sqlalchemy.orm import Session
 
-from .db import get_db
+from . import screen_sources
+from .db import get_read_db
 from .schemas import AnalyzedIssueOut
 
 load_dotenv()
@@ -23,7 +24,7 @@ router = APIRouter()
 def analyze_issues_with_llm(
     screen: str | None = Query(default=None),
     hours: int = Query(default=24, ge=1, le=168),
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
 ) -> list[AnalyzedIssueOut]:
     provider = os.getenv("FOUNDATION_MODEL_PROVIDER", "openai").strip().lower()
     if provider != "openai":
@@ -93,7 +94,6 @@ def _load_screen_metrics(db: Session, hours: int, screen: str | None) -> list[di
             f"""
             SELECT
               COALESCE(screen, '(unknown)') AS screen,
-              MAX(source) FILTER (WHERE source IS NOT NULL) AS source,
               COUNT(*) AS total_events,
               COUNT(*) FILTER (WHERE name='api_error') AS api_error_count,
               COUNT(*) FILTER (WHERE name='api_ok') AS api_ok_count,
@@ -116,6 +116,16 @@ def _load_screen_metrics(db: Session, hours: int, screen: str | None) -> list[di
         params,
     ).mappings().all()
 
+    screen_sources.ensure_loaded(db)
+    reported = screen_sources.reported_sources(
+        db,
+        (
+            str(row["screen"])
+            for row in rows
+            if row["screen"] != "(unknown)" and screen_sources.get_source(str(row["screen"])) is None
+        ),
+        window_start,
+    )
     result: list[dict[str, Any]] = []
     for row in rows:
         screen_name = str(row["screen"])
@@ -142,7 +152,7 @@ def _load_screen_metrics(db: Session, hours: int, screen: str | None) -> list[di
             {
                 "window_hours": hours,
                 "screen": screen_name,
-                "source": row["source"],
+                "source": screen_sources.get_source(screen_name) or reported.get(screen_name),
                 "total_events": int(row["total_events"]),
                 "api_error_count": int(row["api_error_count"]),
                 "api_ok_count": int(row["api_ok_count"]),
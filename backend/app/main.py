@@ -1,7 +1,8 @@
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
-from .db import Base, engine
+from . import screen_sources
+from .db import Base, SessionLocal, write_engine
 from .ingest import router as ingest_router
 from .issues import router as issues_router
 from .llm_analysis import router as llm_analysis_router
@@ -21,7 +22,9 @@ app.add_middleware(
 
 @app.on_event("startup")
 def on_startup() -> None:
-    Base.metadata.create_all(bind=engine)
+    Base.metadata.create_all(bind=write_engine)
+    with SessionLocal() as db:
+        screen_sources.load(db)
 
 
 app.include_router(ingest_router)
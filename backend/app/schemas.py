@@ -61,6 +61,10 @@ class LinkCodeIn(BaseModel):
     source: str
 
 
+class LinkCodeBatchIn(BaseModel):
+    links: list[LinkCodeIn]
+
+
 class AnalyzedIssueOut(BaseModel):
     key: str
     title: str
@@ -0,0 +1,74 @@
+import os
+import threading
+import time
+from collections.abc import Iterable, Mapping
+from datetime import UTC, datetime
+
+from sqlalchemy import select
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.orm import Session
+
+from .models import Event, ScreenLink
+
+# Other workers write screen_links too, so reload periodically.
+SCREEN_SOURCE_REFRESH_SECONDS = float(os.getenv("SCREEN_SOURCE_REFRESH_SECONDS", "60"))
+
+_lock = threading.Lock()
+# Explicit links from /v1/link-code, mirrored from screen_links.
+_sources: dict[str, str] = {}
+_loaded_at: float | None = None
+
+
+def load(db: Session) -> None:
+    global _sources, _loaded_at
+
+    rows = db.execute(select(ScreenLink.screen, ScreenLink.source)).all()
+    with _lock:
+        _sources = {screen: source for screen, source in rows}
+        _loaded_at = time.monotonic()
+
+
+def ensure_loaded(db: Session) -> None:
+    if _loaded_at is None or time.monotonic() - _loaded_at >= SCREEN_SOURCE_REFRESH_SECONDS:
+        load(db)
+
+
+def get_source(screen: str | None) -> str | None:
+    """Return the linked source for a screen."""
+    if screen is None:
+        return None
+    return _sources.get(screen)
+
+
+def reported_sources(db: Session, screens: Iterable[str], since: datetime) -> dict[str, str]:
+    """Return the latest source events reported since `since` for each of `screens`."""
+    screens = list(screens)
+    if not screens:
+        return {}
+    rows = db.execute(
+        select(Event.screen, Event.source)
+        .where(Event.screen.in_(screens), Event.source.is_not(None), Event.ts >= since)
+        .order_by(Event.screen, Event.ts.desc(), Event.id.desc())
+        .distinct(Event.screen)
+    ).all()
+    return {screen: source for screen, source in rows}
+
+
+def upsert(db: Session, links: Mapping[str, str]) -> None:
+    """Write screen->source links. Caller commits, then calls remember()."""
+    if not links:
+        return
+    now = datetime.now(UTC)
+    stmt = insert(ScreenLink)
+    db.execute(
+        stmt.on_conflict_do_update(
+            index_elements=[ScreenLink.screen],
+            set_={"source": stmt.excluded.source, "updated_at": stmt.excluded.updated_at},
+        ),
+        [{"screen": screen, "source": source, "updated_at": now} for screen, source in links.items()],
+    )
+
+
+def remember(links: Mapping[str, str]) -> None:
+    with _lock:
+        _sources.update(links)
@@ -4,7 +4,7 @@ from fastapi import APIRouter, Depends
 from sqlalchemy import select
 from sqlalchemy.orm import Session
 
-from .db import get_db
+from .db import get_read_db
 from .models import Event
 from .schemas import ScreenMetricsOut
 
@@ -15,7 +15,7 @@ router = APIRouter()
 def get_screen_metrics(
     name: str,
     window_hours: int = 24,
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
 ) -> ScreenMetricsOut:
     start = datetime.now(UTC) - timedelta(hours=window_hours)
     rows = db.execute(select(Event).where(Event.screen == name, Event.ts >= start)).scalars().all()
@@ -0,0 +1,53 @@
+"""Per-event overhead of the ingest dedup filter.
+
+Run from backend/: python -m benchmarks.bench_dedup
+"""
+
+import argparse
+import time
+import uuid
+
+from app.dedup import RotatingBloomFilter
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--events", type=int, default=200_000)
+    parser.add_argument("--batch-size", type=int, default=100)
+    parser.add_argument("--duplicate-ratio", type=float, default=0.05)
+    parser.add_argument("--capacity", type=int, default=1_000_000)
+    parser.add_argument("--fp-rate", type=float, default=0.001)
+    args = parser.parse_args()
+
+    unique = int(args.events * (1 - args.duplicate_ratio))
+    ids = [str(uuid.uuid4()) for _ in range(unique)]
+    ids += ids[: args.events - unique]
+
+    started = time.perf_counter()
+    bloom = RotatingBloomFilter(window_seconds=3600, capacity=args.capacity, fp_rate=args.fp_rate)
+    build_s = time.perf_counter() - started
+
+    # Same calls as ingest: check every id, add a batch's accepted ids after its commit.
+    started = time.perf_counter()
+    hits = 0
+    for offset in range(0, len(ids), args.batch_size):
+        accepted = []
+        for event_id in ids[offset : offset + args.batch_size]:
+            if bloom.seen(event_id):
+                hits += 1
+            else:
+                accepted.append(event_id)
+        bloom.add_many(accepted)
+    elapsed = time.perf_counter() - started
+
+    memory_mb = len(bloom._current.bits) * 2 / 1024 / 1024
+    print(f"events:            {len(ids)}")
+    print(f"filter hits:       {hits} (true duplicates: {len(ids) - unique})")
+    print(f"false positives:   {hits - (len(ids) - unique)}")
+    print(f"per-event cost:    {elapsed / len(ids) * 1e6:.2f} us")
+    print(f"throughput:        {len(ids) / elapsed:,.0f} events/s")
+    print(f"filter allocation: {build_s * 1e3:.1f} ms, ~{memory_mb:.1f} MiB for two generations")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,27 @@
+from collections.abc import Generator
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import Session
+from sqlalchemy.pool import StaticPool
+
+from app import screen_sources
+from app.db import Base
+
+
+@pytest.fixture
+def db() -> Generator[Session, None, None]:
+    # SQLite understands the ON CONFLICT inserts the app issues through the postgresql dialect.
+    engine = create_engine(
+        "sqlite://", poolclass=StaticPool, connect_args={"check_same_thread": False}
+    )
+    Base.metadata.create_all(engine)
+    with Session(engine) as session:
+        yield session
+    engine.dispose()
+
+
+@pytest.fixture(autouse=True)
+def reset_screen_sources(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(screen_sources, "_sources", {})
+    monkeypatch.setattr(screen_sources, "_loaded_at", None)
@@ -0,0 +1,65 @@
+import pytest
+from sqlalchemy.exc import OperationalError
+
+from app import db
+
+
+@pytest.fixture
+def replica(monkeypatch: pytest.MonkeyPatch) -> dict:
+    state = {"now": 1000.0, "lag": 0.0, "calls": 0}
+
+    def fake_lag() -> float | None:
+        state["calls"] += 1
+        if isinstance(state["lag"], Exception):
+            raise state["lag"]
+        return state["lag"]
+
+    monkeypatch.setattr(db, "read_engine", object())
+    monkeypatch.setattr(db, "DATABASE_READ_MAX_LAG_SECONDS", 10.0)
+    monkeypatch.setattr(db, "DATABASE_READ_LAG_CHECK_INTERVAL_SECONDS", 5.0)
+    monkeypatch.setattr(db, "replica_lag_seconds", fake_lag)
+    monkeypatch.setattr(db.time, "monotonic", lambda: state["now"])
+    monkeypatch.setattr(db, "_replica_checked_at", 0.0)
+    monkeypatch.setattr(db, "_replica_ok", True)
+    return state
+
+
+def test_lag_within_limit_uses_replica(replica: dict) -> None:
+    replica["lag"] = 3.0
+    assert db.replica_is_fresh() is True
+
+
+def test_lag_over_limit_falls_back(replica: dict) -> None:
+    replica["lag"] = 30.0
+    assert db.replica_is_fresh() is False
+
+
+def test_null_lag_falls_back(replica: dict) -> None:
+    replica["lag"] = None
+    assert db.replica_is_fresh() is False
+
+
+def test_error_falls_back(replica: dict) -> None:
+    replica["lag"] = OperationalError("SELECT 1", {}, Exception("timeout"))
+    assert db.replica_is_fresh() is False
+
+
+def test_result_is_cached_for_interval(replica: dict) -> None:
+    replica["lag"] = 30.0
+    assert db.replica_is_fresh() is False
+
+    replica["lag"] = 0.0
+    replica["now"] += 4
+    assert db.replica_is_fresh() is False
+    assert replica["calls"] == 1
+
+    replica["now"] += 1
+    assert db.replica_is_fresh() is True
+    assert replica["calls"] == 2
+
+
+def test_guard_disabled_skips_check(replica: dict, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(db, "DATABASE_READ_MAX_LAG_SECONDS", 0.0)
+    replica["lag"] = 30.0
+    assert db.replica_is_fresh() is True
+    assert replica["calls"] == 0
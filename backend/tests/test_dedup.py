@@ -0,0 +1,77 @@
+import pytest
+
+from app import dedup
+from app.dedup import RotatingBloomFilter
+
+
+# Negligible false-positive rate, so the logic tests don't depend on the hash seed.
+EXACT = 1e-9
+
+
+@pytest.fixture
+def clock(monkeypatch: pytest.MonkeyPatch) -> list[float]:
+    now = [1000.0]
+    monkeypatch.setattr(dedup.time, "monotonic", lambda: now[0])
+    return now
+
+
+def test_added_keys_are_seen(clock: list[float]) -> None:
+    bloom = RotatingBloomFilter(window_seconds=60, capacity=1000, fp_rate=EXACT)
+
+    assert bloom.seen("evt-1") is False
+    bloom.add_many(["evt-1"])
+
+    assert bloom.seen("evt-1") is True
+    assert bloom.seen("evt-2") is False
+
+
+def test_seen_does_not_add(clock: list[float]) -> None:
+    bloom = RotatingBloomFilter(window_seconds=60, capacity=1000, fp_rate=EXACT)
+
+    assert bloom.seen("evt-1") is False
+    assert bloom.seen("evt-1") is False
+
+
+def test_keys_survive_one_rotation_and_expire_after_two(clock: list[float]) -> None:
+    bloom = RotatingBloomFilter(window_seconds=60, capacity=1000, fp_rate=EXACT)
+    bloom.add_many(["evt-1"])
+
+    clock[0] += 60
+    assert bloom.seen("evt-1") is True
+
+    clock[0] += 60
+    assert bloom.seen("evt-1") is False
+
+
+def test_full_window_rotates_before_time(clock: list[float]) -> None:
+    bloom = RotatingBloomFilter(window_seconds=60, capacity=10, fp_rate=EXACT)
+    bloom.add_many(f"evt-{i}" for i in range(10))
+    bloom.add_many(f"evt-{i}" for i in range(10, 20))
+
+    assert bloom.seen("evt-0") is True
+    assert bloom.seen("evt-19") is True
+
+    bloom.add_many(f"evt-{i}" for i in range(20, 30))
+
+    assert bloom.seen("evt-0") is False
+    assert bloom.seen("evt-29") is True
+
+
+def test_false_positive_rate_one_generation(clock: list[float]) -> None:
+    capacity = 20_000
+    bloom = RotatingBloomFilter(window_seconds=60, capacity=capacity, fp_rate=0.01)
+    bloom.add_many(f"seen-{i}" for i in range(capacity))
+
+    false_positives = sum(bloom.seen(f"unseen-{i}") for i in range(capacity))
+
+    assert false_positives / capacity < 0.015
+
+
+def test_false_positive_rate_both_generations_full(clock: list[float]) -> None:
+    capacity = 20_000
+    bloom = RotatingBloomFilter(window_seconds=60, capacity=capacity, fp_rate=0.01)
+    bloom.add_many(f"seen-{i}" for i in range(2 * capacity))
+
+    false_positives = sum(bloom.seen(f"unseen-{i}") for i in range(capacity))
+
+    assert 0.01 < false_positives / capacity < 0.03
@@ -0,0 +1,104 @@
+from datetime import datetime
+
+import pytest
+from sqlalchemy import func, select
+from sqlalchemy.orm import Session
+
+from app import dedup
+from app.ingest import get_dedup_stats, ingest_events
+from app.models import Event
+from app.schemas import EventBatchIn, EventIn
+
+
+@pytest.fixture(autouse=True)
+def fresh_dedup(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(
+        dedup,
+        "recent_event_ids",
+        dedup.RotatingBloomFilter(window_seconds=600, capacity=1000, fp_rate=1e-9),
+    )
+    monkeypatch.setattr(dedup, "stats", dict.fromkeys(dedup.stats, 0))
+
+
+def make_batch(*event_ids: str) -> EventBatchIn:
+    return EventBatchIn(
+        events=[
+            EventIn(
+                event_id=event_id,
+                name="screen_view",
+                ts=datetime(2026, 1, 1),
+                user_id="u1",
+                session_id="s1",
+                platform="ios",
+                app_version="1.0.0",
+                os_version="17.0",
+                device_model="iPhone",
+                screen="Checkout",
+            )
+            for event_id in event_ids
+        ]
+    )
+
+
+def stored_count(db: Session) -> int:
+    return db.execute(select(func.count()).select_from(Event)).scalar_one()
+
+
+def test_in_batch_duplicates_are_dropped(db: Session) -> None:
+    result = ingest_events(make_batch("e1", "e1", "e2"), db=db)
+
+    assert result == {"ingested": 2, "duplicates": 1}
+    assert stored_count(db) == 2
+    assert get_dedup_stats()["dropped_in_batch"] == 1
+
+
+def test_retried_batch_is_dropped_by_filter(db: Session) -> None:
+    ingest_events(make_batch("e1", "e2"), db=db)
+
+    result = ingest_events(make_batch("e1", "e2", "e3"), db=db)
+
+    assert result == {"ingested": 1, "duplicates": 2}
+    assert stored_count(db) == 3
+    stats = get_dedup_stats()
+    assert stats["received"] == 5
+    assert stats["dropped_by_filter"] == 2
+    assert stats["filter_false_positives"] == 0
+
+
+def test_filter_false_positive_is_ingested(db: Session) -> None:
+    # Mark an id as seen without storing it, as a false positive would.
+    dedup.recent_event_ids.add_many(["e1"])
+
+    result = ingest_events(make_batch("e1"), db=db)
+
+    assert result == {"ingested": 1, "duplicates": 0}
+    stats = get_dedup_stats()
+    assert stats["dropped_by_filter"] == 0
+    assert stats["filter_false_positives"] == 1
+
+
+def test_conflict_backstop_catches_forgotten_ids(db: Session, monkeypatch: pytest.MonkeyPatch) -> None:
+    ingest_events(make_batch("e1"), db=db)
+    # A restart or another worker: the filter has never seen e1.
+    monkeypatch.setattr(
+        dedup,
+        "recent_event_ids",
+        dedup.RotatingBloomFilter(window_seconds=600, capacity=1000, fp_rate=1e-9),
+    )
+
+    result = ingest_events(make_batch("e1", "e2"), db=db)
+
+    assert result == {"ingested": 1, "duplicates": 1}
+    assert stored_count(db) == 2
+    assert get_dedup_stats()["dropped_on_conflict"] == 1
+
+
+def test_failed_commit_does_not_remember_ids(db: Session, monkeypatch: pytest.MonkeyPatch) -> None:
+    def fail() -> None:
+        raise RuntimeError("commit failed")
+
+    monkeypatch.setattr(db, "commit", fail)
+    with pytest.raises(RuntimeError):
+        ingest_events(make_batch("e1"), db=db)
+
+    assert dedup.recent_event_ids.seen("e1") is False
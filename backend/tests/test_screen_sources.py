@@ -0,0 +1,80 @@
+import pytest
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from app import screen_sources
+from app.link_code import link_code, link_code_bulk
+from app.models import ScreenLink
+from app.schemas import LinkCodeBatchIn, LinkCodeIn
+
+
+@pytest.fixture
+def clock(monkeypatch: pytest.MonkeyPatch) -> list[float]:
+    now = [1000.0]
+    monkeypatch.setattr(screen_sources.time, "monotonic", lambda: now[0])
+    return now
+
+
+def test_load_mirrors_screen_links(db: Session) -> None:
+    db.add(ScreenLink(screen="Checkout", source="src/Checkout.tsx"))
+    db.commit()
+
+    screen_sources.load(db)
+
+    assert screen_sources.get_source("Checkout") == "src/Checkout.tsx"
+    assert screen_sources.get_source("Cart") is None
+    assert screen_sources.get_source(None) is None
+
+
+def test_ensure_loaded_reloads_after_refresh_interval(db: Session, clock: list[float]) -> None:
+    screen_sources.ensure_loaded(db)
+    db.add(ScreenLink(screen="Checkout", source="src/Checkout.tsx"))
+    db.commit()
+
+    clock[0] += screen_sources.SCREEN_SOURCE_REFRESH_SECONDS - 1
+    screen_sources.ensure_loaded(db)
+    assert screen_sources.get_source("Checkout") is None
+
+    clock[0] += 1
+    screen_sources.ensure_loaded(db)
+    assert screen_sources.get_source("Checkout") == "src/Checkout.tsx"
+
+
+def test_remember_updates_cache() -> None:
+    screen_sources.remember({"Checkout": "src/Checkout.tsx"})
+
+    assert screen_sources.get_source("Checkout") == "src/Checkout.tsx"
+
+
+def test_link_code_overwrites_existing_link(db: Session) -> None:
+    link_code(LinkCodeIn(screen="Checkout", source="src/Old.tsx"), db=db)
+    link_code(LinkCodeIn(screen="Checkout", source="src/Checkout.tsx"), db=db)
+
+    assert db.execute(select(ScreenLink.source)).scalars().all() == ["src/Checkout.tsx"]
+    assert screen_sources.get_source("Checkout") == "src/Checkout.tsx"
+
+
+def test_link_code_bulk_writes_all_links(db: Session) -> None:
+    payload = LinkCodeBatchIn(
+        links=[
+            LinkCodeIn(screen="Checkout", source="src/Checkout.tsx"),
+            LinkCodeIn(screen="Cart", source="src/Cart.tsx"),
+        ]
+    )
+
+    assert link_code_bulk(payload, db=db) == {"linked": 2}
+    stored = dict(db.execute(select(ScreenLink.screen, ScreenLink.source)).all())
+    assert stored == {"Checkout": "src/Checkout.tsx", "Cart": "src/Cart.tsx"}
+    assert screen_sources.get_source("Cart") == "src/Cart.tsx"
+
+
+def test_failed_commit_leaves_cache_untouched(db: Session, monkeypatch: pytest.MonkeyPatch) -> None:
+    def fail() -> None:
+        raise RuntimeError("commit failed")
+
+    monkeypatch.setattr(db, "commit", fail)
+    payload = LinkCodeBatchIn(links=[LinkCodeIn(screen="Checkout", source="src/Checkout.tsx")])
+
+    with pytest.raises(RuntimeError):
+        link_code_bulk(payload, db=db)
+    assert screen_sources.get_source("Checkout") is None
@@ -36,3 +36,21 @@ export async function fetchIssue(key: string): Promise<Issue> {
   }
   return (await res.json()) as Issue;
 }
+
+export type ScreenLink = {
+  screen: string;
+  source: string;
+};
+
+export async function linkScreens(links: ScreenLink[]): Promise<number> {
+  const url = `${getBaseUrl()}/v1/link-code/bulk`;
+  const res = await fetch(url, {
+    method: "POST",
+    headers: { "Content-Type": "application/json" },
+    body: JSON.stringify({ links }),
+  });
+  if (!res.ok) {
+    throw new Error(`Failed to link screens: ${res.status}`);
+  }
+  return ((await res.json()) as { linked: number }).linked;
+}
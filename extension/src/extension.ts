@@ -1,7 +1,7 @@
 import * as path from "path";
 import * as vscode from "vscode";
 
-import { fetchIssue, fetchIssues } from "./api";
+import { ScreenLink, fetchIssue, fetchIssues, linkScreens } from "./api";
 import { IssuesProvider } from "./views";
 
 export function activate(context: vscode.ExtensionContext): void {
@@ -61,7 +61,21 @@ export function activate(context: vscode.ExtensionContext): void {
     }
   });
 
-  context.subscriptions.push(refreshCmd, openIssueCmd, openSourceCmd);
+  const linkScreensCmd = vscode.commands.registerCommand("uxpulse.linkScreens", async () => {
+    try {
+      const links = await findScreenLinks();
+      if (links.length === 0) {
+        vscode.window.showWarningMessage("No trackScreen(...) calls found in this workspace.");
+        return;
+      }
+      const linked = await linkScreens(links);
+      vscode.window.showInformationMessage(`UXPulse linked ${linked} screens`);
+    } catch (err) {
+      vscode.window.showErrorMessage(`Link screens failed: ${toErrorMessage(err)}`);
+    }
+  });
+
+  context.subscriptions.push(refreshCmd, openIssueCmd, openSourceCmd, linkScreensCmd);
   void vscode.commands.executeCommand("uxpulse.refresh");
 }
 
@@ -75,6 +89,22 @@ function resolveSourcePath(source: string): string {
   return path.resolve(root, source);
 }
 
+// Maps each screen passed to the SDK's trackScreen("Name", ...) to the file making the call.
+async function findScreenLinks(): Promise<ScreenLink[]> {
+  const files = await vscode.workspace.findFiles("**/*.{ts,tsx,js,jsx}", "**/node_modules/**");
+  const pattern = /trackScreen\(\s*["'`]([^"'`]+)["'`]/g;
+  const links = new Map<string, string>();
+  for (const file of files) {
+    const text = Buffer.from(await vscode.workspace.fs.readFile(file)).toString("utf8");
+    for (const match of text.matchAll(pattern)) {
+      if (!links.has(match[1])) {
+        links.set(match[1], vscode.workspace.asRelativePath(file, false));
+      }
+    }
+  }
+  return [...links].map(([screen, source]) => ({ screen, source }));
+}
+
 function escapeHtml(input: string): string {
   return input.replace(/[&<>"']/g, (c) => {
     const map: Record<string, string> = {
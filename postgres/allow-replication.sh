@@ -0,0 +1,4 @@
+#!/bin/sh
+# Lets the postgres-replica service stream WAL from this server.
+set -e
+echo "host replication all all scram-sha-256" >> "$PGDATA/pg_hba.conf"